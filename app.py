@@ -1,10 +1,20 @@
+import heapq
+import io
+import itertools
 import os
 import re
-import base64
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 from flask import Flask, render_template, request
 from dotenv import load_dotenv
-import json
+import orjson
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from cachetools import LRUCache, TTLCache, cached
+
+_loads = orjson.loads
 
 load_dotenv()
 
@@ -12,6 +22,9 @@ app = Flask(__name__)
 
 GEMINI_API_KEY = os.getenv('GEMINI_API_KEY')
 GITHUB_TOKEN = os.getenv('GITHUB_TOKEN', '')
+GITHUB_TOKENS = [
+    token.strip() for token in os.getenv('GITHUB_TOKENS', '').split(',') if token.strip()
+] or ([GITHUB_TOKEN] if GITHUB_TOKEN else [])
 
 IGNORE_FOLDERS = {
     'node_modules', 'venv', '.git', 'dist', 'build', 
@@ -28,33 +41,182 @@ DEPENDENCY_FILES = [
     'Makefile', 'Dockerfile', 'docker-compose.yml', 'docker-compose.yaml'
 ]
 
+_REPO_URL_RE = re.compile(r'(?:https?://)?(?:www\.)?github\.com/([^/]+)/([^/\s?#]+)')
+_IGNORE_FOLDERS_LC = frozenset(f.lower() for f in IGNORE_FOLDERS)
+_DEPENDENCY_FILES_SET = frozenset(DEPENDENCY_FILES)
+_FENCE_RE = re.compile(r'\A\s*```(?:json)?\s*|\s*```\s*\Z')
+
+GEMINI_URL = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-flash-latest:generateContent?key={GEMINI_API_KEY}"
+
+GEMINI_GENERATION_CONFIG = {
+    "temperature": 0.3,
+    "maxOutputTokens": 2000
+}
+
+GIT_TREE_TYPES = {'blob': 'file', 'tree': 'dir', 'commit': 'submodule'}
+
+MAX_STRUCTURE_ENTRIES = 300
 
-def get_github_headers():
+MAX_RETRY_AFTER = 5
+
+_TOKEN_CYCLE = itertools.cycle(GITHUB_TOKENS)
+_TOKEN_LOCK = threading.Lock()
+_TOKEN_RESETS = {}
+
+
+def next_github_token(resource='core'):
+    if not GITHUB_TOKENS:
+        return None
+    
+    now = time.time()
+    with _TOKEN_LOCK:
+        for _ in range(len(GITHUB_TOKENS)):
+            token = next(_TOKEN_CYCLE)
+            if _TOKEN_RESETS.get((token, resource), 0) <= now:
+                return token
+    return token
+
+
+def record_rate_limit(response, *args, **kwargs):
+    authorization = response.request.headers.get('Authorization', '')
+    remaining = response.headers.get('X-RateLimit-Remaining')
+    if not authorization.startswith('token ') or remaining is None:
+        return
+    
+    key = (authorization[len('token '):], response.headers.get('X-RateLimit-Resource', 'core'))
+    with _TOKEN_LOCK:
+        if remaining == '0':
+            _TOKEN_RESETS[key] = int(response.headers.get('X-RateLimit-Reset', 0))
+        else:
+            _TOKEN_RESETS.pop(key, None)
+
+
+def get_github_headers(resource='core'):
     headers = {
         'Accept': 'application/vnd.github.v3+json',
+        'Accept-Encoding': 'gzip',
         'User-Agent': 'ExplainMyRepo/1.0'
     }
     
-    if GITHUB_TOKEN:
-        headers['Authorization'] = f'token {GITHUB_TOKEN}'
+    token = next_github_token(resource)
+    if token:
+        headers['Authorization'] = f'token {token}'
     
     return headers
 
 
+class CappedRetry(Retry):
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_AFTER)
+
+
+def create_session(headers=None, retry=None):
+    session = requests.Session()
+    if headers:
+        session.headers.update(headers)
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry or 0)
+    session.mount('https://', adapter)
+    return session
+
+
+_GH_RETRY = CappedRetry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=['GET', 'POST'],
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+
+_GEMINI_RETRY = Retry(
+    total=2,
+    read=0,
+    backoff_factor=0.3,
+    status_forcelist=[500, 502, 503, 504],
+    allowed_methods=['POST'],
+    raise_on_status=False
+)
+
+_GH_SESSION = create_session(retry=_GH_RETRY)
+_GH_SESSION.hooks['response'].append(record_rate_limit)
+_GEMINI_SESSION = create_session({'Content-Type': 'application/json'}, retry=_GEMINI_RETRY)
+_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix='github-fetch')
+
+_RESPONSE_CACHE = TTLCache(maxsize=512, ttl=600)
+_VALIDATOR_CACHE = LRUCache(maxsize=1024)
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+_ANALYSIS_CACHE = LRUCache(maxsize=1024)
+_ANALYSIS_CACHE_LOCK = threading.Lock()
+
+
+def cached_get(url, as_json=True, max_bytes=None, accept=None, transform=None, revalidate=False):
+    key = (url, as_json)
+    with _RESPONSE_CACHE_LOCK:
+        hit = _RESPONSE_CACHE.get(key)
+        validators = _VALIDATOR_CACHE.get(key)
+    if hit is not None and not revalidate:
+        return hit
+    
+    headers = get_github_headers()
+    if accept:
+        headers['Accept'] = accept
+    if validators:
+        etag, last_modified, _ = validators
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+    
+    with _GH_SESSION.get(url, headers=headers, timeout=10, stream=max_bytes is not None) as response:
+        if response.status_code == 304 and validators:
+            result = validators[2]
+            with _RESPONSE_CACHE_LOCK:
+                _RESPONSE_CACHE[key] = result
+            return result
+        
+        payload = None
+        if response.status_code == 200:
+            if as_json:
+                payload = _loads(response.content)
+            elif max_bytes is not None:
+                body = response.raw.read(max_bytes, decode_content=True)
+                payload = body.decode('utf-8', errors='ignore')
+            else:
+                payload = response.text
+            if transform:
+                payload = transform(payload)
+        result = (response.status_code, payload, response.headers)
+    
+    if response.status_code in (200, 404):
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        with _RESPONSE_CACHE_LOCK:
+            _RESPONSE_CACHE[key] = result
+            if response.status_code == 200 and (etag or last_modified):
+                _VALIDATOR_CACHE[key] = (etag, last_modified, result)
+    return result
+
+
+@cached(TTLCache(maxsize=1, ttl=60), lock=threading.Lock())
 def check_rate_limit():
     try:
-        response = requests.get(
+        response = _GH_SESSION.get(
             'https://api.github.com/rate_limit',
             headers=get_github_headers(),
             timeout=10
         )
         if response.status_code == 200:
-            data = response.json()
+            data = _loads(response.content)
             core = data.get('resources', {}).get('core', {})
             return {
                 'limit': core.get('limit', 0),
                 'remaining': core.get('remaining', 0),
-                'reset_time': core.get('reset', 0)
+                'reset_time': core.get('reset', 0),
+                'note': 'Conditional requests answered with 304 Not Modified do not count against this limit.'
             }
     except Exception:
         pass
@@ -64,104 +226,158 @@ def check_rate_limit():
 def extract_repo_info(github_url):
     github_url = github_url.strip().rstrip('/')
     
-    patterns = [
-        r'(?:https?://)?(?:www\.)?github\.com/([^/]+)/([^/\s?#]+)',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, github_url)
-        if match:
-            owner = match.group(1)
-            repo = match.group(2).replace('.git', '')
-            return owner, repo
+    match = _REPO_URL_RE.search(github_url)
+    if match:
+        owner = match.group(1)
+        repo = match.group(2).replace('.git', '')
+        return owner, repo
     
     return None, None
 
 
-def fetch_readme(owner, repo, headers):
-    readme_url = f"https://api.github.com/repos/{owner}/{repo}/readme"
-    
+def check_fetch_status(status, url):
+    if status not in (200, 404):
+        raise requests.exceptions.HTTPError(f"GitHub API error (Status: {status}) for {url}")
+
+
+def future_result(future, default):
     try:
-        response = requests.get(readme_url, headers=headers, timeout=10)
-        if response.status_code == 200:
-            readme_data = response.json()
-            content = readme_data.get('content', '')
-            encoding = readme_data.get('encoding', 'base64')
-            
-            if encoding == 'base64' and content:
-                decoded = base64.b64decode(content).decode('utf-8', errors='ignore')
-                return decoded[:8000] if len(decoded) > 8000 else decoded
-        return None
+        return future.result(), True
     except Exception:
-        return None
+        return default, False
+
+
+def fetch_readme(owner, repo, revalidate=False):
+    readme_url = f"https://api.github.com/repos/{owner}/{repo}/readme"
+    
+    status, content, _ = cached_get(
+        readme_url,
+        as_json=False,
+        max_bytes=16384,
+        accept='application/vnd.github.raw+json',
+        revalidate=revalidate
+    )
+    check_fetch_status(status, readme_url)
+    if status == 200 and content:
+        return content[:8000] if len(content) > 8000 else content
+    return None
 
 
-def fetch_repo_structure(owner, repo, headers):
-    contents_url = f"https://api.github.com/repos/{owner}/{repo}/contents"
+def _structure_sort_key(item):
+    path = item['path']
+    return (path.count('/'), 0 if item['type'] == 'dir' else 1, path.lower())
+
+
+def build_structure(items):
     structure = []
     
-    try:
-        response = requests.get(contents_url, headers=headers, timeout=10)
-        if response.status_code == 200:
-            contents = response.json()
-            for item in contents:
-                name = item.get('name', '')
-                item_type = item.get('type', '')
-                
-                if name.lower() in {f.lower() for f in IGNORE_FOLDERS}:
-                    continue
-                
-                structure.append({
-                    'name': name,
-                    'type': item_type,
-                    'path': item.get('path', name)
-                })
-            
-            structure.sort(key=lambda x: (0 if x['type'] == 'dir' else 1, x['name'].lower()))
+    for item in items:
+        path = item.get('path') or item.get('name', '')
         
-        return structure
-    except Exception:
+        if any(part.lower() in _IGNORE_FOLDERS_LC for part in path.split('/')):
+            continue
+        
+        structure.append({
+            'name': path.rsplit('/', 1)[-1],
+            'type': item.get('type', ''),
+            'path': path
+        })
+    
+    return heapq.nsmallest(MAX_STRUCTURE_ENTRIES, structure, key=_structure_sort_key)
+
+
+def reduce_tree(tree):
+    return {
+        'truncated': tree.get('truncated', False),
+        'structure': build_structure(
+            {
+                'type': GIT_TREE_TYPES.get(entry.get('type'), entry.get('type', '')),
+                'path': entry.get('path', '')
+            }
+            for entry in tree.get('tree', [])
+        )
+    }
+
+
+def fetch_repo_structure(owner, repo, default_branch='main', revalidate=False):
+    tree_url = f"https://api.github.com/repos/{owner}/{repo}/git/trees/{default_branch}"
+    
+    status, tree, _ = cached_get(f"{tree_url}?recursive=1", transform=reduce_tree, revalidate=revalidate)
+    check_fetch_status(status, tree_url)
+    if status != 200:
         return []
+    
+    structure = tree['structure']
+    
+    if tree['truncated']:
+        top_status, top_tree, _ = cached_get(tree_url, transform=reduce_tree, revalidate=revalidate)
+        check_fetch_status(top_status, tree_url)
+        if top_status == 200:
+            known_paths = {item['path'] for item in structure}
+            structure = build_structure(structure + [
+                item for item in top_tree['structure']
+                if item['path'] not in known_paths
+            ])
+    
+    return structure
 
 
-def fetch_dependency_files(owner, repo, headers, structure):
+def fetch_raw_file(owner, repo, branch, path, revalidate=False):
+    file_url = f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{path}"
+    
+    status, content, _ = cached_get(file_url, as_json=False, max_bytes=16384, revalidate=revalidate)
+    check_fetch_status(status, file_url)
+    if status == 200:
+        return content[:4000] if len(content) > 4000 else content
+    return None
+
+
+def fetch_dependency_files(owner, repo, structure, default_branch='main', revalidate=False):
     dependencies = {}
+    complete = True
+    
+    futures = [
+        (item['name'], _EXECUTOR.submit(fetch_raw_file, owner, repo, default_branch, item['path'], revalidate))
+        for item in structure
+        if item['type'] == 'file' and item['path'] in _DEPENDENCY_FILES_SET
+    ]
     
-    for item in structure:
-        if item['type'] == 'file' and item['name'] in DEPENDENCY_FILES:
-            for branch in ['main', 'master']:
-                file_url = f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{item['path']}"
-                try:
-                    response = requests.get(file_url, timeout=10)
-                    if response.status_code == 200:
-                        content = response.text
-                        dependencies[item['name']] = content[:4000] if len(content) > 4000 else content
-                        break
-                except Exception:
-                    continue
+    for name, future in futures:
+        content, ok = future_result(future, None)
+        complete = complete and ok
+        if content is not None:
+            dependencies[name] = content
     
-    return dependencies
+    return dependencies, complete
 
 
-def fetch_github_data(owner, repo):
-    headers = get_github_headers()
+def fetch_languages(owner, repo, revalidate=False):
+    lang_url = f"https://api.github.com/repos/{owner}/{repo}/languages"
     
+    status, languages, _ = cached_get(lang_url, revalidate=revalidate)
+    check_fetch_status(status, lang_url)
+    if status == 200:
+        return languages
+    return {}
+
+
+def fetch_repo_info(owner, repo):
     repo_url = f"https://api.github.com/repos/{owner}/{repo}"
     
     try:
-        response = requests.get(repo_url, headers=headers, timeout=10)
+        status, repo_info, response_headers = cached_get(repo_url, revalidate=True)
         
-        remaining = response.headers.get('X-RateLimit-Remaining', 'unknown')
-        limit = response.headers.get('X-RateLimit-Limit', 'unknown')
+        remaining = response_headers.get('X-RateLimit-Remaining', 'unknown')
+        limit = response_headers.get('X-RateLimit-Limit', 'unknown')
         
-        if response.status_code == 404:
+        if status == 404:
             return None, f"Repository '{owner}/{repo}' not found. Make sure it exists and is public."
         
-        elif response.status_code == 403:
-            reset_time = response.headers.get('X-RateLimit-Reset', '')
+        elif status == 403:
+            reset_time = response_headers.get('X-RateLimit-Reset', '')
             if remaining == '0':
                 error_msg = "GitHub API rate limit exceeded.\n\n"
-                if not GITHUB_TOKEN:
+                if not GITHUB_TOKENS:
                     error_msg += "💡 TIP: Add a GitHub token to your .env file to get 5000 requests/hour instead of 60.\n"
                     error_msg += "Get one at: https://github.com/settings/tokens"
                 else:
@@ -170,28 +386,31 @@ def fetch_github_data(owner, repo):
             else:
                 return None, "Access forbidden. The repository might be private."
         
-        elif response.status_code != 200:
-            return None, f"GitHub API error (Status: {response.status_code})"
+        elif status != 200:
+            return None, f"GitHub API error (Status: {status})"
         
-        repo_info = response.json()
+        return repo_info, None
         
     except requests.exceptions.Timeout:
         return None, "Request timed out. Please try again."
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
         return None, f"Network error: {str(e)}"
+
+
+def fetch_github_data(owner, repo, repo_info):
+    default_branch = repo_info.get('default_branch', 'main')
     
-    readme = fetch_readme(owner, repo, headers)
-    structure = fetch_repo_structure(owner, repo, headers)
-    dependencies = fetch_dependency_files(owner, repo, headers, structure)
+    readme_future = _EXECUTOR.submit(fetch_readme, owner, repo, True)
+    structure_future = _EXECUTOR.submit(fetch_repo_structure, owner, repo, default_branch, True)
+    languages_future = _EXECUTOR.submit(fetch_languages, owner, repo, True)
     
-    languages = {}
-    try:
-        lang_url = f"https://api.github.com/repos/{owner}/{repo}/languages"
-        lang_response = requests.get(lang_url, headers=headers, timeout=10)
-        if lang_response.status_code == 200:
-            languages = lang_response.json()
-    except Exception:
-        pass
+    structure, structure_ok = future_result(structure_future, [])
+    dependencies, dependencies_ok = fetch_dependency_files(owner, repo, structure, default_branch, revalidate=True)
+    
+    readme, readme_ok = future_result(readme_future, None)
+    languages, languages_ok = future_result(languages_future, {})
+    
+    complete = structure_ok and dependencies_ok and readme_ok and languages_ok
 
     return {
         'readme': readme,
@@ -203,33 +422,24 @@ def fetch_github_data(owner, repo):
         'topics': repo_info.get('topics', []),
         'stars': repo_info.get('stargazers_count', 0),
         'forks': repo_info.get('forks_count', 0)
-    }, None
+    }, complete
 
 
 def call_gemini_api(prompt):
-    url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-flash-latest:generateContent?key={GEMINI_API_KEY}"
-    
-    headers = {
-        'Content-Type': 'application/json'
-    }
-    
-    data = {
+    data = orjson.dumps({
         "contents": [{
             "parts": [{
                 "text": prompt
             }]
         }],
-        "generationConfig": {
-            "temperature": 0.3,
-            "maxOutputTokens": 2000
-        }
-    }
+        "generationConfig": GEMINI_GENERATION_CONFIG
+    })
     
     try:
-        response = requests.post(url, headers=headers, json=data, timeout=60)
+        response = _GEMINI_SESSION.post(GEMINI_URL, data=data, timeout=60)
         
         if response.status_code == 200:
-            result = response.json()
+            result = _loads(response.content)
             if 'candidates' in result and len(result['candidates']) > 0:
                 candidate = result['candidates'][0]
                 if 'content' in candidate and 'parts' in candidate['content']:
@@ -238,7 +448,7 @@ def call_gemini_api(prompt):
                         return parts[0]['text'], None
             return None, "Unexpected response format from Gemini API"
         else:
-            error_msg = response.json().get('error', {}).get('message', 'Unknown error')
+            error_msg = _loads(response.content).get('error', {}).get('message', 'Unknown error')
             return None, f"Gemini API error: {error_msg}"
     
     except requests.exceptions.Timeout:
@@ -252,16 +462,17 @@ def call_gemini_api(prompt):
 def generate_analysis(repo_data, owner, repo):
     
     structure_text = '\n'.join([
-        f"  {'📁' if item['type'] == 'dir' else '📄'} {item['name']}"
+        f"  {'📁' if item['type'] == 'dir' else '📄'} {item['path']}"
         for item in repo_data.get('structure', [])
     ]) or 'No structure data available'
     
-    deps_text = ''
+    buf = io.StringIO()
     for filename, content in repo_data.get('dependencies', {}).items():
-        deps_text += f"\n--- {filename} ---\n{content}\n"
+        buf.write(f"\n--- {filename} ---\n")
+        buf.write(content)
+        buf.write("\n")
     
-    if not deps_text:
-        deps_text = 'No dependency files found'
+    deps_text = buf.getvalue() or 'No dependency files found'
     
     prompt = f"""You are an expert software analyst helping recruiters and developers understand GitHub projects.
 Analyze this repository and provide a clear, accurate analysis in JSON format.
@@ -311,15 +522,7 @@ Example of architecture_mermaid:
 
 def parse_analysis(analysis_text):
     try:
-        cleaned_text = analysis_text.strip()
-        if cleaned_text.startswith('```json'):
-            cleaned_text = cleaned_text[7:]
-        if cleaned_text.startswith('```'):
-            cleaned_text = cleaned_text[3:]
-        if cleaned_text.endswith('```'):
-            cleaned_text = cleaned_text[:-3]
-        
-        data = json.loads(cleaned_text.strip())
+        data = _loads(_FENCE_RE.sub('', analysis_text))
         
         default_keys = [
             'tech_stack', 'project_type', 'architecture_mermaid', 
@@ -330,6 +533,8 @@ def parse_analysis(analysis_text):
             if key not in data:
                 if key == 'architecture_mermaid':
                     data[key] = ""
+                elif key == 'tech_stack':
+                    data[key] = ["Not available"]
                 else:
                     data[key] = "Not available"
 
@@ -346,29 +551,26 @@ def parse_analysis(analysis_text):
             if data['architecture_mermaid'].lower() == 'not available':
                 data['architecture_mermaid'] = ""
                 
-        if isinstance(data['tech_stack'], list):
-            data['tech_stack'] = ', '.join(data['tech_stack'])
+        if not isinstance(data['tech_stack'], list):
+            data['tech_stack'] = [str(data['tech_stack'])]
             
         return data
         
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         return {
-            'tech_stack': 'Error parsing analysis',
+            'tech_stack': ['Error parsing analysis'],
             'project_type': 'Error parsing analysis',
             'architecture_mermaid': '',
             'architecture_description': 'Error parsing analysis',
             'what_it_does': 'Error parsing analysis',
-            'recruiter_summary': 'Error parsing analysis: ' + analysis_text[:100] + '...'
+            'recruiter_summary': 'Error parsing analysis: ' + analysis_text[:100] + '...',
+            'parse_error': True
         }
 
 
 @app.route('/')
 def index():
-    rate_info = check_rate_limit()
-    show_warning = False
-    if rate_info and rate_info['remaining'] < 10 and not GITHUB_TOKEN:
-        show_warning = True
-    return render_template('index.html', show_rate_warning=show_warning, has_token=bool(GITHUB_TOKEN))
+    return render_template('index.html', has_token=bool(GITHUB_TOKENS))
 
 
 @app.route('/analyze', methods=['POST'])
@@ -387,21 +589,37 @@ def analyze():
                              error="Invalid GitHub URL format. Please use a URL like: https://github.com/username/repository",
                              error_type="validation")
     
-    repo_data, fetch_error = fetch_github_data(owner, repo)
+    repo_info, fetch_error = fetch_repo_info(owner, repo)
     
     if fetch_error:
         return render_template('error.html',
                              error=fetch_error,
                              error_type="github")
     
-    analysis_text, gemini_error = generate_analysis(repo_data, owner, repo)
-    
-    if gemini_error:
-        return render_template('error.html',
-                             error=gemini_error,
-                             error_type="gemini")
-    
-    sections = parse_analysis(analysis_text)
+    cache_key = None
+    cached_result = None
+    if repo_info.get('pushed_at'):
+        cache_key = (repo_info.get('full_name', f"{owner}/{repo}").lower(), repo_info['pushed_at'])
+        with _ANALYSIS_CACHE_LOCK:
+            cached_result = _ANALYSIS_CACHE.get(cache_key)
+    
+    if cached_result:
+        sections, repo_data = cached_result
+    else:
+        repo_data, complete = fetch_github_data(owner, repo, repo_info)
+        
+        analysis_text, gemini_error = generate_analysis(repo_data, owner, repo)
+        
+        if gemini_error:
+            return render_template('error.html',
+                                 error=gemini_error,
+                                 error_type="gemini")
+        
+        sections = parse_analysis(analysis_text)
+        
+        if cache_key and complete and not sections.get('parse_error'):
+            with _ANALYSIS_CACHE_LOCK:
+                _ANALYSIS_CACHE[cache_key] = (sections, repo_data)
     
     return render_template('results.html',
                          owner=owner,
@@ -416,7 +634,7 @@ def rate_limit():
     rate_info = check_rate_limit()
     return {
         'rate_limit': rate_info,
-        'has_token': bool(GITHUB_TOKEN)
+        'has_token': bool(GITHUB_TOKENS)
     }
 
 
@@ -441,11 +659,12 @@ def server_error(e):
 
 if __name__ == '__main__':
     
-    rate_info = check_rate_limit()
-    if rate_info:
-        print(f"Github Token Rate Limit: {rate_info['remaining']}/{rate_info['limit']} remaining")
     port = int(os.getenv('PORT', 5000))
     debug = os.getenv('FLASK_DEBUG', 'True').lower() == 'true'
+    if debug:
+        rate_info = check_rate_limit()
+        if rate_info:
+            print(f"Github Token Rate Limit: {rate_info['remaining']}/{rate_info['limit']} remaining")
     app.run(host='0.0.0.0', port=port, debug=debug)
 
 
@@ -0,0 +1,7 @@
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', 5000)}"
+worker_class = 'gevent'
+workers = int(os.getenv('WEB_CONCURRENCY', 2))
+worker_connections = 100
+timeout = 120